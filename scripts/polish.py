@@ -12,6 +12,7 @@ import argparse
 import logging
 import shutil
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
@@ -382,8 +383,7 @@ class DocumentPolisher:
             """
         # Count by severity
         severity_counts = {s.value: 0 for s in Severity}
-        for amb in ambiguities:
-            severity_counts[amb.severity.value] += 1
+        severity_counts.update(Counter(amb.severity.value for amb in ambiguities))
 
         for sev, count in severity_counts.items():
             emoji = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}.get(sev, "⚪")
@@ -14,9 +14,19 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+import json_codec
+
 # Logger for judge responses
 judge_logger = logging.getLogger("judge_responses")
 
+# JSON object inside a ```/```json fenced block
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+# Flat JSON object containing an "interpretation" key
+_INTERPRETATION_OBJECT_RE = re.compile(r'\{[^{}]*"interpretation"[^{}]*\}', re.DOTALL)
+# Keyword candidates (lowercase words of 3+ letters) and standalone numbers
+_WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+_NUMBER_RE = re.compile(r"\b\d+\b")
+
 
 class Severity(Enum):
     """Ambiguity severity levels"""
@@ -45,7 +55,7 @@ class JudgeFailureError(Exception):
         super().__init__(message)
 
 
-@dataclass
+@dataclass(slots=True)
 class Interpretation:
     """Parsed interpretation from a model response"""
 
@@ -86,30 +96,30 @@ class Interpretation:
 
         # Try direct parse
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return json_codec.loads(text)
+        except json_codec.JSONDecodeError:
             pass
 
         # Try to find JSON block in markdown
-        json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
+        json_match = _FENCED_JSON_RE.search(text)
         if json_match:
             try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
+                return json_codec.loads(json_match.group(1))
+            except json_codec.JSONDecodeError:
                 pass
 
         # Try to find raw JSON object
-        json_match = re.search(r'\{[^{}]*"interpretation"[^{}]*\}', text, re.DOTALL)
+        json_match = _INTERPRETATION_OBJECT_RE.search(text)
         if json_match:
             try:
-                return json.loads(json_match.group(0))
-            except json.JSONDecodeError:
+                return json_codec.loads(json_match.group(0))
+            except json_codec.JSONDecodeError:
                 pass
 
         return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class Ambiguity:
     """Detected ambiguity in a documentation section"""
 
@@ -165,6 +175,69 @@ class SimpleComparisonStrategy(ComparisonStrategy):
     No external dependencies required.
     """
 
+    # Common words ignored when extracting keywords
+    STOPWORDS = frozenset(
+        {
+            "the",
+            "a",
+            "an",
+            "is",
+            "are",
+            "was",
+            "were",
+            "be",
+            "been",
+            "being",
+            "have",
+            "has",
+            "had",
+            "do",
+            "does",
+            "did",
+            "will",
+            "would",
+            "could",
+            "should",
+            "may",
+            "might",
+            "must",
+            "shall",
+            "can",
+            "need",
+            "to",
+            "of",
+            "in",
+            "for",
+            "on",
+            "with",
+            "at",
+            "by",
+            "from",
+            "as",
+            "into",
+            "through",
+            "and",
+            "or",
+            "but",
+            "if",
+            "then",
+            "else",
+            "when",
+            "where",
+            "which",
+            "that",
+            "this",
+            "these",
+            "those",
+            "it",
+            "its",
+            "i",
+            "you",
+            "we",
+            "they",
+        }
+    )
+
     def __init__(self, similarity_threshold: float = 0.7):
         self.similarity_threshold = similarity_threshold
 
@@ -185,18 +258,20 @@ class SimpleComparisonStrategy(ComparisonStrategy):
                 }
             )
 
-        # Compare pairwise
+        # Compare pairwise - each (i, j) similarity is computed once and reused for grouping
+        pair_similarity: Dict[tuple, float] = {}
         similarities = []
         for i in range(len(elements)):
             for j in range(i + 1, len(elements)):
                 sim = self._calculate_similarity(elements[i], elements[j])
+                pair_similarity[(i, j)] = sim
                 similarities.append({"pair": (elements[i]["model"], elements[j]["model"]), "similarity": sim})
 
         avg_similarity = sum(s["similarity"] for s in similarities) / len(similarities) if similarities else 1.0
         agree = avg_similarity >= self.similarity_threshold
 
         # Group by similarity
-        groups = self._group_by_similarity(interpretations, elements)
+        groups = self._group_by_similarity(interpretations, elements, pair_similarity)
 
         # Build details
         details_parts = []
@@ -233,73 +308,12 @@ class SimpleComparisonStrategy(ComparisonStrategy):
         # Normalize
         text = text.lower()
 
-        # Remove common words
-        stopwords = {
-            "the",
-            "a",
-            "an",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "shall",
-            "can",
-            "need",
-            "to",
-            "of",
-            "in",
-            "for",
-            "on",
-            "with",
-            "at",
-            "by",
-            "from",
-            "as",
-            "into",
-            "through",
-            "and",
-            "or",
-            "but",
-            "if",
-            "then",
-            "else",
-            "when",
-            "where",
-            "which",
-            "that",
-            "this",
-            "these",
-            "those",
-            "it",
-            "its",
-            "i",
-            "you",
-            "we",
-            "they",
-        }
-
         # Extract words
-        words = re.findall(r"\b[a-z]{3,}\b", text)
-        keywords = set(words) - stopwords
+        words = _WORD_RE.findall(text)
+        keywords = set(words) - self.STOPWORDS
 
         # Also extract numbers (important for quantities)
-        numbers = re.findall(r"\b\d+\b", text)
+        numbers = _NUMBER_RE.findall(text)
         keywords.update(numbers)
 
         return keywords
@@ -326,8 +340,10 @@ class SimpleComparisonStrategy(ComparisonStrategy):
         # Weighted combination
         return 0.7 * keyword_sim + 0.3 * step_sim
 
-    def _group_by_similarity(self, interpretations: List[Interpretation], elements: List[Dict]) -> List[List[str]]:
-        """Group models by similar interpretations"""
+    def _group_by_similarity(
+        self, interpretations: List[Interpretation], elements: List[Dict], pair_similarity: Dict[tuple, float]
+    ) -> List[List[str]]:
+        """Group models by similar interpretations, using the precomputed (i, j) pair similarities"""
         if len(interpretations) <= 1:
             return [[interp.model_name for interp in interpretations]]
 
@@ -342,10 +358,10 @@ class SimpleComparisonStrategy(ComparisonStrategy):
             group = [elem["model"]]
             used.add(elem["model"])
 
-            for _j, other_elem in enumerate(elements[i + 1 :], i + 1):
+            for j, other_elem in enumerate(elements[i + 1 :], i + 1):
                 if other_elem["model"] in used:
                     continue
-                if self._calculate_similarity(elem, other_elem) >= self.similarity_threshold:
+                if pair_similarity[(i, j)] >= self.similarity_threshold:
                     group.append(other_elem["model"])
                     used.add(other_elem["model"])
 
@@ -8,10 +8,12 @@ disagreements between model interpretations.
 
 import json
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
+import json_codec
 from ambiguity_detector import Ambiguity, AmbiguityDetector, JudgeFailureError, Severity
 from model_interface import ModelManager
 
@@ -60,8 +62,7 @@ class DetectionResult:
 
         ambiguities_data = [amb.to_dict() for amb in self.ambiguities]
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(ambiguities_data, f, indent=2, ensure_ascii=False)
+        json_codec.dump_file(ambiguities_data, output_file)
 
     @classmethod
     def load(cls, input_path: str) -> "DetectionResult":
@@ -84,22 +85,43 @@ class DetectionResult:
         if not input_file.exists():
             raise FileNotFoundError(f"Ambiguities file not found: {input_path}")
 
-        with open(input_file, "r", encoding="utf-8") as f:
-            ambiguities_data = json.load(f)
+        ambiguities_data = json_codec.load_file(input_file)
 
-        # Convert JSON to Ambiguity objects
+        # Convert JSON to Ambiguity objects. Identical interpretations (same model,
+        # text and lists) are loaded once and shared between ambiguities.
+        interp_cache: Dict[tuple, Interpretation] = {}
         ambiguities = []
         for amb_data in ambiguities_data:
             interpretations = {}
             for model_name, interp_data in amb_data["interpretations"].items():
-                interpretations[model_name] = Interpretation(
-                    model_name=model_name,
-                    raw_response="",
-                    interpretation=interp_data.get("interpretation", ""),
-                    steps=interp_data.get("steps", []),
-                    assumptions=interp_data.get("assumptions", []),
-                    ambiguities=interp_data.get("ambiguities", []),
-                )
+                steps = interp_data.get("steps", [])
+                assumptions = interp_data.get("assumptions", [])
+                noted_ambiguities = interp_data.get("ambiguities", [])
+                try:
+                    key = (
+                        model_name,
+                        interp_data.get("interpretation", ""),
+                        tuple(steps),
+                        tuple(assumptions),
+                        tuple(noted_ambiguities),
+                    )
+                    interp = interp_cache.get(key)
+                except TypeError:
+                    # null lists or non-string entries (e.g. dicts) can't form a key - don't share
+                    key, interp = None, None
+
+                if interp is None:
+                    interp = Interpretation(
+                        model_name=model_name,
+                        raw_response="",
+                        interpretation=interp_data.get("interpretation", ""),
+                        steps=steps,
+                        assumptions=assumptions,
+                        ambiguities=noted_ambiguities,
+                    )
+                    if key is not None:
+                        interp_cache[key] = interp
+                interpretations[model_name] = interp
 
             ambiguities.append(
                 Ambiguity(
@@ -113,10 +135,7 @@ class DetectionResult:
             )
 
         # Calculate severity counts
-        severity_counts = {}
-        for amb in ambiguities:
-            sev = amb.severity.value
-            severity_counts[sev] = severity_counts.get(sev, 0) + 1
+        severity_counts = dict(Counter(amb.severity.value for amb in ambiguities))
 
         return cls(
             ambiguities=ambiguities,
@@ -220,10 +239,7 @@ class DetectionStep:
         ambiguities = detector.detect(test_results)
 
         # Calculate severity counts
-        severity_counts = {}
-        for amb in ambiguities:
-            sev = amb.severity.value
-            severity_counts[sev] = severity_counts.get(sev, 0) + 1
+        severity_counts = dict(Counter(amb.severity.value for amb in ambiguities))
 
         return DetectionResult(
             ambiguities=ambiguities,
@@ -4,6 +4,14 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Markdown header: "#".."######" followed by the title
+_HEADER_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+
+# Ambiguity heuristics used by extract_ambiguous_patterns
+_VAGUE_QUANTIFIER_RE = re.compile(r"\b(N|several|some|many|all|each)\s+(\w+)", re.IGNORECASE)
+_IMPLICIT_REFERENCE_RE = re.compile(r"\b(the|this|that)\s+(process|output|result|value)\b", re.IGNORECASE)
+_UNDEFINED_TERM_RE = re.compile(r"\b(standard|required|necessary|appropriate)\s+(\w+)", re.IGNORECASE)
+
 
 class DocumentProcessor:
     """Processes markdown documents to extract testable sections"""
@@ -50,11 +58,11 @@ class DocumentProcessor:
 
         for i, line in enumerate(lines):
             # Check for code fence toggling (``` with optional language identifier)
-            if re.match(r"^```", line.strip()):
+            if line.lstrip().startswith("```"):
                 in_code_fence = not in_code_fence
 
             # Check if line is a header (only if not inside a code fence)
-            header_match = re.match(r"^(#{1,6})\s+(.+)$", line) if not in_code_fence else None
+            header_match = _HEADER_RE.match(line) if not in_code_fence else None
 
             if header_match:
                 # Save previous section if it has content
@@ -106,10 +114,8 @@ class DocumentProcessor:
         if len(text.strip()) < 10:
             return False
 
-        # Check for instruction keywords
-        keyword_count = sum(1 for keyword in self.INSTRUCTION_KEYWORDS if keyword in text_lower)
-
-        return keyword_count > 0
+        # Check for instruction keywords - stop at the first hit
+        return any(keyword in text_lower for keyword in self.INSTRUCTION_KEYWORDS)
 
     def get_section_by_index(self, index: int) -> Optional[Dict]:
         """Get a specific section by index"""
@@ -135,7 +141,7 @@ def extract_ambiguous_patterns(text: str) -> List[Dict]:
     patterns = []
 
     # Pattern 1: Vague quantifiers
-    vague_quantifiers = re.finditer(r"\b(N|several|some|many|all|each)\s+(\w+)", text, re.IGNORECASE)
+    vague_quantifiers = _VAGUE_QUANTIFIER_RE.finditer(text)
     for match in vague_quantifiers:
         patterns.append(
             {
@@ -147,14 +153,14 @@ def extract_ambiguous_patterns(text: str) -> List[Dict]:
         )
 
     # Pattern 2: Implicit references (the, this, that without clear antecedent)
-    implicit_refs = re.finditer(r"\b(the|this|that)\s+(process|output|result|value)\b", text, re.IGNORECASE)
+    implicit_refs = _IMPLICIT_REFERENCE_RE.finditer(text)
     for match in implicit_refs:
         patterns.append(
             {"type": "implicit_reference", "text": match.group(0), "position": match.start(), "severity": "medium"}
         )
 
     # Pattern 3: Undefined "standard" or "required"
-    undefined_terms = re.finditer(r"\b(standard|required|necessary|appropriate)\s+(\w+)", text, re.IGNORECASE)
+    undefined_terms = _UNDEFINED_TERM_RE.finditer(text)
     for match in undefined_terms:
         patterns.append(
             {"type": "undefined_term", "text": match.group(0), "position": match.start(), "severity": "medium"}
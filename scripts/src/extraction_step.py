@@ -5,11 +5,11 @@ This module provides a clean interface for Step 1 of the document polishing pipe
 It wraps the DocumentProcessor to extract sections and provides serialization for the results.
 """
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List
 
+import json_codec
 from document_processor import DocumentProcessor
 
 
@@ -44,8 +44,7 @@ class ExtractionResult:
             "document_path": self.document_path,
         }
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        json_codec.dump_file(data, output_file)
 
     @classmethod
     def load(cls, input_path: str) -> "ExtractionResult":
@@ -66,8 +65,7 @@ class ExtractionResult:
         if not input_file.exists():
             raise FileNotFoundError(f"Extraction result not found: {input_path}")
 
-        with open(input_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.load_file(input_file)
 
         return cls(
             sections=data.get("sections", []),
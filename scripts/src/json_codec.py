@@ -0,0 +1,91 @@
+"""JSON Codec - Fast JSON parsing and serialization with a stdlib fallback
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise. Both backends write 2-space indented UTF-8 (same as
+json.dump(..., indent=2, ensure_ascii=False)). datetime and dataclass values
+go through `default` on both backends, so `default=str` writes the same text.
+
+The backends still differ on values the pipeline does not produce:
+- plain Enum members: orjson writes the value, stdlib calls `default`
+  (str/int-mixin enums match)
+- float formatting: orjson writes 1e-05 as 0.00001 and 1e+20 as 1e20
+- NaN and Infinity: orjson writes null, stdlib writes NaN/Infinity
+- integers beyond 64 bits: orjson raises TypeError
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both backends
+JSONDecodeError = json.JSONDecodeError
+
+# Hand datetime and dataclass values to `default` like the stdlib does, instead of orjson's native output
+_ORJSON_DUMP_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+    if orjson is not None
+    else 0
+)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from a str or UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """Load JSON from a file"""
+    if orjson is not None:
+        # Parse the raw bytes directly - skips decoding the whole file to str first
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=_ORJSON_DUMP_OPTIONS)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=default).encode("utf-8")
+
+
+def dump_file(obj: Any, path: Union[str, Path], default: Optional[Callable[[Any], Any]] = None):
+    """Write obj to a file as indented UTF-8 JSON"""
+    Path(path).write_bytes(dumps(obj, default=default))
+
+
+def strip_code_fences(text: str) -> str:
+    """Strip markdown code fences wrapping a model response (e.g., ```json ... ```)"""
+    # Plain prefix/suffix checks rather than a regex: a lazy body followed by \s*\Z
+    # backtracks quadratically on long whitespace runs
+    text = text.strip()
+    if text.startswith("```json"):
+        text = text[len("```json") :]
+    elif text.startswith("```"):
+        text = text[len("```") :]
+    if text.endswith("```"):
+        text = text[: -len("```")]
+    return text.strip()
+
+
+def parse_response(text: str) -> Optional[Any]:
+    """
+    Parse a model response as a JSON object or array, tolerating markdown code fences.
+
+    Returns None when the text is not shaped like JSON or fails to parse, so prose
+    responses never pay for a failed parse.
+    """
+    body = strip_code_fences(text)
+    if body[:1] not in ("{", "["):
+        return None
+    try:
+        return loads(body)
+    except JSONDecodeError:
+        return None
@@ -1,14 +1,19 @@
 """Model Interface - Handles communication with AI models via CLI"""
 
-import json
+import concurrent.futures
+import copy
+import hashlib
 import os
 import subprocess
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 _NOHOOKS_DIR = Path.home() / ".config" / "nohooks"
 
+import json_codec
 from session_handlers import SessionCreationError, SessionQueryError
 from session_manager import SessionManager
 
@@ -65,17 +70,12 @@ class CLIModel(ModelInterface):
             if result.returncode != 0:
                 return {"error": True, "stderr": result.stderr, "raw_response": result.stdout}
 
-            # Try to parse as JSON first
-            try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError:
-                # Try stripping markdown code blocks and parsing again
-                stripped = self._strip_markdown_code_blocks(result.stdout)
-                try:
-                    return json.loads(stripped)
-                except json.JSONDecodeError:
-                    # Return as raw text if still not JSON
-                    return {"error": False, "raw_response": result.stdout.strip()}
+            parsed = json_codec.parse_response(result.stdout)
+            if parsed is not None:
+                return parsed
+
+            # Return as raw text if not JSON
+            return {"error": False, "raw_response": result.stdout.strip()}
 
         except subprocess.TimeoutExpired:
             return {"error": True, "message": f"Timeout after {self.timeout}s"}
@@ -84,19 +84,6 @@ class CLIModel(ModelInterface):
         except Exception as e:
             return {"error": True, "message": str(e)}
 
-    def _strip_markdown_code_blocks(self, text: str) -> str:
-        """Strip markdown code blocks from text (e.g., ```json ... ```)"""
-        text = text.strip()
-        # Remove ```json or ``` at start
-        if text.startswith("```json"):
-            text = text[7:]
-        elif text.startswith("```"):
-            text = text[3:]
-        # Remove ``` at end
-        if text.endswith("```"):
-            text = text[:-3]
-        return text.strip()
-
 
 class ModelFactory:
     """Factory for creating model instances"""
@@ -122,13 +109,26 @@ class ModelFactory:
 class ModelManager:
     """Manages multiple model instances with optional session support"""
 
-    def __init__(self, models_config: Dict[str, Dict[str, Any]], session_config: Dict[str, Any] = None):
+    def __init__(
+        self, models_config: Dict[str, Dict[str, Any]], session_config: Dict[str, Any] = None, cache_size: int = 256
+    ):
+        """
+        Args:
+            models_config: Model configuration dict from config.yaml
+            session_config: Optional session management configuration
+            cache_size: Max stateless responses kept for identical prompts (0 disables caching)
+        """
         self.models = {}
         self.config = models_config
         self.session_config = session_config or {}
         self.session_manager: Optional[SessionManager] = None
         self._sessions_enabled = self.session_config.get("enabled", False)
 
+        # LRU cache of stateless responses: (model_name, prompt digest) -> response
+        self.cache_size = cache_size
+        self._response_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         # Initialize enabled models
         for name, config in models_config.items():
             if config.get("enabled", True):
@@ -156,7 +156,12 @@ class ModelManager:
         if model_names is None:
             model_names = list(self.models.keys())
 
-        self.session_manager = SessionManager(self.config, self.session_config)
+        # Reuse the manager (and its per-model session handlers) across documents;
+        # sessions from a previous document must not leak into this one
+        if self.session_manager is None:
+            self.session_manager = SessionManager(self.config, self.session_config)
+        else:
+            self.session_manager.cleanup_sessions()
 
         # Initialize sessions in parallel
         results = self.session_manager.init_sessions_parallel(model_names, document, purpose)
@@ -193,12 +198,50 @@ class ModelManager:
                 print(f"  ⚠ Session query failed for {model_name}, falling back to stateless: {e}")
                 # Fall through to stateless query
 
-        # Stateless query (original behavior)
-        return self.models[model_name].query(prompt)
+        # Stateless query - identical prompts reuse the earlier response instead of spawning the CLI again
+        cache_key = self._cache_key(model_name, prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = self.models[model_name].query(prompt)
+        if isinstance(response, dict) and not response.get("error"):
+            self._cache_put(cache_key, response)
+        return response
+
+    def _cache_key(self, model_name: str, prompt: str) -> tuple:
+        """Build cache key from model name and prompt digest"""
+        return (model_name, hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest())
+
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached response, or None on miss"""
+        if self.cache_size <= 0:
+            return None
+        with self._cache_lock:
+            response = self._response_cache.get(key)
+            if response is None:
+                return None
+            self._response_cache.move_to_end(key)
+        return copy.deepcopy(response)
+
+    def _cache_put(self, key: tuple, response: Dict[str, Any]):
+        """Store a copy of a response, evicting the least recently used entry when full"""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._response_cache[key] = copy.deepcopy(response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached stateless responses"""
+        with self._cache_lock:
+            self._response_cache.clear()
 
     def query_all(self, prompt: str, model_names: list = None, use_session: bool = True) -> Dict[str, Dict[str, Any]]:
         """
-        Query multiple models with the same prompt.
+        Query multiple models with the same prompt in parallel.
 
         Args:
             prompt: Query prompt
@@ -211,13 +254,26 @@ class ModelManager:
         if model_names is None:
             model_names = list(self.models.keys())
 
+        available = [name for name in model_names if name in self.models]
+        futures = {}
+
+        # Each model is a separate CLI process, so wall time is the slowest model rather than the sum
+        if available:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(available)) as executor:
+                for name in available:
+                    print(f"  Querying {name}...")
+                    futures[name] = executor.submit(self.query, name, prompt, use_session)
+
         results = {}
         for name in model_names:
-            if name in self.models:
-                print(f"  Querying {name}...")
-                results[name] = self.query(name, prompt, use_session=use_session)
-            else:
+            future = futures.get(name)
+            if future is None:
                 results[name] = {"error": True, "message": f"Model '{name}' not found"}
+                continue
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = {"error": True, "message": str(e)}
 
         return results
 
@@ -8,12 +8,15 @@ This module implements Step 5 of the document polishing pipeline:
 - Score comprehension and map issues to ambiguity-compatible objects
 """
 
+import concurrent.futures
 import hashlib
 import json
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import json_codec
 import yaml
 from ambiguity_detector import Ambiguity, Interpretation, Severity
 from model_interface import ModelManager
@@ -24,7 +27,10 @@ class QuestionSetValidationError(ValueError):
     """Raised when question set YAML fails validation."""
 
 
-@dataclass
+VALID_DIFFICULTIES = frozenset({"basic", "standard", "advanced"})
+
+
+@dataclass(slots=True)
 class QuestionExpected:
     """Expected answer structure for a question."""
 
@@ -42,7 +48,7 @@ class QuestionExpected:
             self.anti_point_ids = [_generate_point_id(point, "ap") for point in self.anti_points]
 
 
-@dataclass
+@dataclass(slots=True)
 class WholeDocumentQuestion:
     """Single whole-document question."""
 
@@ -68,7 +74,7 @@ class QuestionSet:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionEvaluation:
     """Evaluation for one model answer on one question."""
 
@@ -114,8 +120,7 @@ class QuestioningResult:
         workspace.mkdir(parents=True, exist_ok=True)
 
         responses_file = workspace / "question_responses.json"
-        with open(responses_file, "w", encoding="utf-8") as f:
-            json.dump(self.responses, f, indent=2, ensure_ascii=False)
+        json_codec.dump_file(self.responses, responses_file)
 
         evaluations_file = workspace / "question_evaluations.json"
         evaluations_payload = {
@@ -173,8 +178,7 @@ class QuestioningResult:
                 for qid, model_evals in self.evaluations.items()
             },
         }
-        with open(evaluations_file, "w", encoding="utf-8") as f:
-            json.dump(evaluations_payload, f, indent=2, ensure_ascii=False)
+        json_codec.dump_file(evaluations_payload, evaluations_file)
 
     @classmethod
     def load(cls, workspace_path: str) -> "QuestioningResult":
@@ -188,11 +192,8 @@ class QuestioningResult:
         if not evaluations_file.exists():
             raise FileNotFoundError(f"Question evaluations not found: {evaluations_file}")
 
-        with open(responses_file, "r", encoding="utf-8") as f:
-            responses = json.load(f)
-
-        with open(evaluations_file, "r", encoding="utf-8") as f:
-            payload = json.load(f)
+        responses = json_codec.load_file(responses_file)
+        payload = json_codec.load_file(evaluations_file)
 
         question_set_payload = payload["question_set"]
         question_set = load_question_set_from_dict(question_set_payload)
@@ -332,14 +333,18 @@ def assign_verdict(
 
 def categorize_consensus(model_evaluations: Dict[str, QuestionEvaluation]) -> str:
     """Categorize consensus for one question across models."""
-    verdicts = [ev.verdict for ev in model_evaluations.values()]
+    # One pass over the verdicts: unanimity means exactly one distinct verdict
+    verdicts = {ev.verdict for ev in model_evaluations.values()}
+    if len(verdicts) != 1:
+        return "mixed"
 
-    if verdicts and all(v == "correct" for v in verdicts):
+    (verdict,) = verdicts
+    if verdict == "correct":
         return "all correct"
-    if verdicts and all(v == "evasive" for v in verdicts):
+    if verdict == "evasive":
         return "all evasive"
 
-    if verdicts and all(v == "incorrect" for v in verdicts):
+    if verdict == "incorrect":
         signatures = {
             (
                 ev.matched_key_points,
@@ -387,7 +392,7 @@ def load_question_set_from_dict(payload: Dict[str, Any]) -> QuestionSet:
             raise QuestionSetValidationError(f"Missing required field: {location}.expected.key_points")
 
         difficulty = question_data.get("difficulty", "standard")
-        if difficulty not in {"basic", "standard", "advanced"}:
+        if difficulty not in VALID_DIFFICULTIES:
             raise QuestionSetValidationError(
                 f"Invalid difficulty at {location}.difficulty: {difficulty}. Must be one of basic, standard, advanced"
             )
@@ -459,6 +464,10 @@ class QuestioningStep:
         self.session_config = session_config or {}
         self.judge_model = judge_model
 
+        # Stateless judge manager, created on first use and shared by all (concurrent) judge calls
+        self._judge_manager: Optional[ModelManager] = None
+        self._judge_manager_lock = threading.Lock()
+
     def run(
         self,
         question_set: QuestionSet,
@@ -488,16 +497,33 @@ class QuestioningStep:
         question_scores: Dict[str, float] = {}
 
         for question in question_set.questions:
-            responses[question.id] = {}
+            # Ask every model the same question concurrently
+            prompt = self._build_question_prompt(question)
+            responses[question.id] = model_manager.query_all(prompt, model_names, use_session=True)
+
+        # Judge calls are independent of each other - dispatch all (question, model) pairs at once,
+        # keeping as many in flight as there are models being tested. Models that gave the exact
+        # same answer to a question share one judge call.
+        judge_futures: Dict[tuple, concurrent.futures.Future] = {}
+        futures_by_answer: Dict[tuple, concurrent.futures.Future] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(model_names))) as executor:
+            for question in question_set.questions:
+                for model_name in model_names:
+                    answer_text = _extract_answer_text(responses[question.id][model_name])
+                    answer_key = (question.id, answer_text)
+                    if answer_key not in futures_by_answer:
+                        futures_by_answer[answer_key] = executor.submit(
+                            self._evaluate_answer, question=question, model_name=model_name, answer_text=answer_text
+                        )
+                    judge_futures[(question.id, model_name)] = futures_by_answer[answer_key]
+
+        for question in question_set.questions:
             evaluations[question.id] = {}
 
             for model_name in model_names:
-                prompt = self._build_question_prompt(question)
-                response = model_manager.query(model_name, prompt, use_session=True)
-                responses[question.id][model_name] = response
-
-                answer_text = _extract_answer_text(response)
-                evaluation = self._evaluate_answer(question=question, model_name=model_name, answer_text=answer_text)
+                evaluation = judge_futures[(question.id, model_name)].result()
+                if evaluation.model_name != model_name:
+                    evaluation = replace(evaluation, model_name=model_name)
                 evaluations[question.id][model_name] = evaluation
 
                 if evaluation.verdict != "correct":
@@ -508,7 +534,7 @@ class QuestioningStep:
                             "model_name": model_name,
                             "verdict": evaluation.verdict,
                             "issue_type": issue_type,
-                            "answer_summary": _summarize_text(answer_text),
+                            "answer_summary": _summarize_text(evaluation.answer_text),
                             "issue": _build_issue_description(question, evaluation, issue_type),
                             "expected": "; ".join(question.expected.key_points),
                             "question": question.question,
@@ -537,7 +563,7 @@ class QuestioningStep:
         self, question: WholeDocumentQuestion, model_name: str, answer_text: str
     ) -> QuestionEvaluation:
         """Evaluate one answer with LLM-as-Judge."""
-        judge_manager = ModelManager(self.models_config, self.session_config)
+        judge_manager = self._get_judge_manager()
 
         judge_prompt = self._build_judge_prompt(question, answer_text)
         judge_response = judge_manager.query(self.judge_model, judge_prompt, use_session=False)
@@ -546,11 +572,14 @@ class QuestioningStep:
         key_point_coverage: Dict[str, Optional[bool]] = {}
         anti_point_presence: Dict[str, bool] = {}
 
+        key_point_results = _index_judge_entries(judge_payload, "key_points")
+        anti_point_results = _index_judge_entries(judge_payload, "anti_points")
+
         for point, point_id in zip(question.expected.key_points, question.expected.key_point_ids, strict=True):
-            key_point_coverage[point] = _lookup_boolean_result(judge_payload, "key_points", point_id, "matched")
+            key_point_coverage[point] = _lookup_boolean_result(key_point_results, point_id, "matched")
 
         for point, point_id in zip(question.expected.anti_points, question.expected.anti_point_ids, strict=True):
-            anti_result = _lookup_boolean_result(judge_payload, "anti_points", point_id, "present")
+            anti_result = _lookup_boolean_result(anti_point_results, point_id, "present")
             anti_point_presence[point] = bool(anti_result) if anti_result is not None else False
 
         matched_key_points = sum(1 for matched in key_point_coverage.values() if matched is True)
@@ -583,6 +612,13 @@ class QuestioningStep:
             reasoning=str(judge_payload.get("reasoning", "")),
         )
 
+    def _get_judge_manager(self) -> ModelManager:
+        """Return the shared judge ModelManager, creating it on first use."""
+        with self._judge_manager_lock:
+            if self._judge_manager is None:
+                self._judge_manager = ModelManager(self.models_config, self.session_config)
+            return self._judge_manager
+
     def _build_question_prompt(self, question: WholeDocumentQuestion) -> str:
         """Build model prompt for the scenario question."""
         return (
@@ -661,35 +697,29 @@ def _parse_judge_payload(judge_response: Dict[str, Any]) -> Dict[str, Any]:
     if not raw:
         return {"key_points": [], "anti_points": [], "is_evasive": False, "reasoning": ""}
 
-    # Try direct parse
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        pass
-
-    # Try markdown fenced JSON
-    stripped = raw.strip()
-    if stripped.startswith("```json"):
-        stripped = stripped[7:]
-    elif stripped.startswith("```"):
-        stripped = stripped[3:]
-    if stripped.endswith("```"):
-        stripped = stripped[:-3]
-    stripped = stripped.strip()
-
-    try:
-        return json.loads(stripped)
-    except json.JSONDecodeError:
+    # Plain or markdown fenced JSON
+    parsed = json_codec.parse_response(raw)
+    if not isinstance(parsed, dict):
         return {"key_points": [], "anti_points": [], "is_evasive": False, "reasoning": "Judge parse failure"}
+    return parsed
+
+
+def _index_judge_entries(payload: Dict[str, Any], key: str) -> Dict[str, Dict[str, Any]]:
+    """Index judge payload entries under key by stable identifier (first entry per id wins)."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for entry in payload.get(key, []):
+        index.setdefault(str(entry.get("id", "")).strip(), entry)
+    return index
 
 
-def _lookup_boolean_result(payload: Dict[str, Any], key: str, point_id: str, result_field: str) -> Optional[bool]:
-    """Find boolean point result in judge payload by stable identifier."""
-    entries = payload.get(key, [])
-    for entry in entries:
-        if str(entry.get("id", "")).strip() == point_id.strip():
-            return bool(entry.get(result_field, False))
-    return None
+def _lookup_boolean_result(
+    entries_by_id: Dict[str, Dict[str, Any]], point_id: str, result_field: str
+) -> Optional[bool]:
+    """Find boolean point result in indexed judge entries by stable identifier."""
+    entry = entries_by_id.get(point_id.strip())
+    if entry is None:
+        return None
+    return bool(entry.get(result_field, False))
 
 
 def _generate_point_id(point_text: str, prefix: str) -> str:
@@ -6,6 +6,7 @@ It generates formatted markdown reports from ambiguity detection results and cre
 polished versions of documents with clarification markers.
 """
 
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -123,8 +124,7 @@ class ReportingStep:
 """
         # Count by severity
         severity_counts = {s.value: 0 for s in Severity}
-        for amb in ambiguities:
-            severity_counts[amb.severity.value] += 1
+        severity_counts.update(Counter(amb.severity.value for amb in ambiguities))
 
         for sev, count in severity_counts.items():
             emoji = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}.get(sev, "⚪")
@@ -225,9 +225,10 @@ class ReportingStep:
 
         # Consensus summary
         if question_result.consensus:
-            all_correct = sum(1 for v in question_result.consensus.values() if v == "all correct")
-            mixed = sum(1 for v in question_result.consensus.values() if v == "mixed")
-            all_incorrect = sum(1 for v in question_result.consensus.values() if v not in {"all correct", "mixed"})
+            consensus_counts = Counter(question_result.consensus.values())
+            all_correct = consensus_counts["all correct"]
+            mixed = consensus_counts["mixed"]
+            all_incorrect = len(question_result.consensus) - all_correct - mixed
             if all_correct == total_questions:
                 section += "\nAll models answered all questions correctly"
                 section += " — document is clear on tested topics.\n"
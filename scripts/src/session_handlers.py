@@ -1,6 +1,5 @@
 """Session Handlers - Model-specific session management implementations"""
 
-import json
 import os
 import re
 import subprocess
@@ -8,8 +7,13 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import json_codec
+
 _NOHOOKS_DIR = Path.home() / ".config" / "nohooks"
 
+# Codex prints e.g. "session id: <uuid>" when a new session starts
+_CODEX_SESSION_ID_RE = re.compile(r"session\s*id:\s*([a-f0-9-]+)", re.IGNORECASE)
+
 
 class SessionError(Exception):
     """Base exception for session errors"""
@@ -106,26 +110,10 @@ class BaseSessionHandler(ABC):
     def _parse_response(self, stdout: str) -> Dict[str, Any]:
         """Parse response, attempting JSON first"""
         stdout = stdout.strip()
-        try:
-            return json.loads(stdout)
-        except json.JSONDecodeError:
-            # Try stripping markdown code blocks
-            stripped = self._strip_markdown_code_blocks(stdout)
-            try:
-                return json.loads(stripped)
-            except json.JSONDecodeError:
-                return {"raw_response": stdout}
-
-    def _strip_markdown_code_blocks(self, text: str) -> str:
-        """Strip markdown code blocks from text"""
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        elif text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        return text.strip()
+        parsed = json_codec.parse_response(stdout)
+        if parsed is not None:
+            return parsed
+        return {"raw_response": stdout}
 
 
 class ClaudeSessionHandler(BaseSessionHandler):
@@ -153,12 +141,12 @@ class ClaudeSessionHandler(BaseSessionHandler):
 
         # Parse JSON response to extract session_id
         try:
-            response = json.loads(result.stdout)
+            response = json_codec.loads(result.stdout)
             session_id = response.get("session_id")
             if not session_id:
                 raise SessionCreationError("No session_id in Claude response")
             return session_id
-        except json.JSONDecodeError:
+        except json_codec.JSONDecodeError:
             raise SessionCreationError(f"Failed to parse Claude response: {result.stdout[:200]}")
 
     def query_session(self, session_id: str, prompt: str) -> Dict[str, Any]:
@@ -173,9 +161,8 @@ class ClaudeSessionHandler(BaseSessionHandler):
 
         if result.returncode != 0:
             # Check if session lost
-            if "session" in result.stderr.lower() and (
-                "not found" in result.stderr.lower() or "invalid" in result.stderr.lower()
-            ):
+            stderr_lower = result.stderr.lower()
+            if "session" in stderr_lower and ("not found" in stderr_lower or "invalid" in stderr_lower):
                 raise SessionLostError(f"Claude session {session_id} lost: {result.stderr}")
             raise SessionQueryError(f"Claude query failed: {result.stderr}")
 
@@ -221,9 +208,8 @@ class GeminiSessionHandler(BaseSessionHandler):
         result = self._run_command(cmd, input_text=None)
 
         if result.returncode != 0:
-            if "session" in result.stderr.lower() and (
-                "not found" in result.stderr.lower() or "invalid" in result.stderr.lower()
-            ):
+            stderr_lower = result.stderr.lower()
+            if "session" in stderr_lower and ("not found" in stderr_lower or "invalid" in stderr_lower):
                 raise SessionLostError(f"Gemini session lost: {result.stderr}")
             raise SessionQueryError(f"Gemini query failed: {result.stderr}")
 
@@ -268,7 +254,7 @@ class CodexSessionHandler(BaseSessionHandler):
     def _extract_session_id(self, output: str) -> Optional[str]:
         """Extract session ID from Codex output"""
         # Look for pattern like "session id: <uuid>" or "Session ID: <uuid>"
-        match = re.search(r"session\s*id:\s*([a-f0-9-]+)", output, re.IGNORECASE)
+        match = _CODEX_SESSION_ID_RE.search(output)
         if match:
             return match.group(1)
         return None
@@ -285,9 +271,8 @@ class CodexSessionHandler(BaseSessionHandler):
         result = self._run_command(cmd, input_text=None)
 
         if result.returncode != 0:
-            if "session" in result.stderr.lower() and (
-                "not found" in result.stderr.lower() or "no" in result.stderr.lower()
-            ):
+            stderr_lower = result.stderr.lower()
+            if "session" in stderr_lower and ("not found" in stderr_lower or "no" in stderr_lower):
                 raise SessionLostError(f"Codex session lost: {result.stderr}")
             raise SessionQueryError(f"Codex query failed: {result.stderr}")
 
@@ -5,11 +5,11 @@ This module provides a clean interface for Step 2 of the document polishing pipe
 It initializes model sessions with full document context to improve interpretation quality.
 """
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import json_codec
 from session_manager import SessionManager
 
 
@@ -41,8 +41,7 @@ class SessionInitResult:
 
         data = {"session_ids": self.session_ids, "failed_models": self.failed_models, "enabled": self.enabled}
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        json_codec.dump_file(data, output_file)
 
     @classmethod
     def load(cls, input_path: str) -> "SessionInitResult":
@@ -66,8 +65,7 @@ class SessionInitResult:
         if not input_file.exists():
             raise FileNotFoundError(f"Session metadata not found: {input_path}")
 
-        with open(input_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.load_file(input_file)
 
         return cls(
             session_ids=data.get("session_ids", {}),
@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import json_codec
 from model_interface import ModelManager
 from prompt_generator import PromptGenerator
 from session_manager import SessionManager
@@ -39,8 +40,7 @@ class TestingResult:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(self.test_results, f, indent=2, default=str, ensure_ascii=False)
+        json_codec.dump_file(self.test_results, output_file, default=str)
 
     @classmethod
     def load(cls, input_path: str) -> "TestingResult":
@@ -61,8 +61,7 @@ class TestingResult:
         if not input_file.exists():
             raise FileNotFoundError(f"Testing result not found: {input_path}")
 
-        with open(input_file, "r", encoding="utf-8") as f:
-            test_results = json.load(f)
+        test_results = json_codec.load_file(input_file)
 
         # Extract model names from first section
         model_names = []
@@ -144,8 +143,7 @@ class TestingStep:
 
             if resume and partial_path.exists():
                 try:
-                    with open(partial_path, "r", encoding="utf-8") as f:
-                        test_results = json.load(f)
+                    test_results = json_codec.load_file(partial_path)
                     start_index = len(test_results)
                     print(f"  Resuming from {partial_path} (skipped {start_index} sections)")
                 except (json.JSONDecodeError, IOError) as e:
@@ -168,8 +166,10 @@ class TestingStep:
             # Partial save
             if partial_path:
                 partial_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(partial_path, "w", encoding="utf-8") as f:
-                    json.dump(test_results, f, indent=2, default=str, ensure_ascii=False)
+                # Serialize before opening so a failure can't truncate the last good partial file
+                data = json_codec.dumps(test_results, default=str)
+                with open(partial_path, "wb") as f:
+                    f.write(data)
                     # Force data to be written to disk immediately
                     f.flush()
                     os.fsync(f.fileno())
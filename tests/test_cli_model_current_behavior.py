@@ -57,3 +57,39 @@ def test_query_handles_timeout(monkeypatch):
     res = model.query("prompt")
     assert res.get("error") is True
     assert "Timeout" in res.get("message", "")
+
+
+def test_query_skips_parsing_prose(monkeypatch):
+    model_interface = __import__("model_interface")
+    CLIModel = model_interface.CLIModel
+
+    payload = "  I would create three files.\n"
+
+    def fake_run(cmd, input, capture_output, text, timeout, env=None, cwd=None):
+        return FakeCompletedProcess(stdout=payload, stderr="", returncode=0)
+
+    def fail_loads(data):
+        raise AssertionError("prose should not be parsed")
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setattr(model_interface.json_codec, "loads", fail_loads)
+
+    model = CLIModel(command="gemini")
+    res = model.query("prompt")
+    assert res == {"error": False, "raw_response": payload.strip()}
+
+
+def test_query_returns_raw_for_top_level_scalar(monkeypatch):
+    model_interface = __import__("model_interface")
+    CLIModel = model_interface.CLIModel
+
+    payload = '"just a string"'
+
+    def fake_run(cmd, input, capture_output, text, timeout, env=None, cwd=None):
+        return FakeCompletedProcess(stdout=payload, stderr="", returncode=0)
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+
+    model = CLIModel(command="gemini")
+    res = model.query("prompt")
+    assert res == {"error": False, "raw_response": payload}
@@ -0,0 +1,93 @@
+"""Tests for DetectionResult save/load round-trips."""
+
+import sys
+from pathlib import Path
+
+# Make scripts/src importable
+project_root = Path(__file__).resolve().parents[1]
+scripts_src = project_root.joinpath("scripts", "src")
+sys.path.insert(0, scripts_src.as_posix())
+
+from ambiguity_detector import Ambiguity, Interpretation, Severity
+from detection_step import DetectionResult
+
+
+def make_ambiguity(section_id, interpretations, severity=Severity.MEDIUM):
+    """Helper to create Ambiguity objects for testing."""
+    return Ambiguity(
+        section_id=section_id,
+        section_header=f"Header {section_id}",
+        section_content="Content",
+        severity=severity,
+        interpretations=interpretations,
+        comparison_details={"details": "differs"},
+    )
+
+
+class TestDetectionResultLoad:
+    """Tests for DetectionResult.load."""
+
+    def test_round_trip_preserves_fields(self, tmp_path):
+        """Saved ambiguities should load back with the same content and severity counts."""
+        interp = Interpretation(
+            model_name="claude", raw_response="", interpretation="Do X", steps=["a", "b"], assumptions=["c"]
+        )
+        result = DetectionResult(
+            ambiguities=[
+                make_ambiguity("section_0", {"claude": interp}, Severity.HIGH),
+                make_ambiguity("section_1", {"claude": interp}, Severity.LOW),
+            ]
+        )
+        output = tmp_path / "ambiguities.json"
+        result.save(str(output))
+
+        loaded = DetectionResult.load(str(output))
+
+        assert [a.section_id for a in loaded.ambiguities] == ["section_0", "section_1"]
+        assert loaded.severity_counts == {"high": 1, "low": 1}
+        loaded_interp = loaded.ambiguities[0].interpretations["claude"]
+        assert loaded_interp.interpretation == "Do X"
+        assert loaded_interp.steps == ["a", "b"]
+        assert loaded_interp.assumptions == ["c"]
+
+    def test_identical_interpretations_are_shared(self, tmp_path):
+        """Identical (model, interpretation) entries across ambiguities should load as one object."""
+        interp = Interpretation(model_name="gemini", raw_response="", interpretation="Same", steps=["s1"])
+        other = Interpretation(model_name="gemini", raw_response="", interpretation="Different")
+        result = DetectionResult(
+            ambiguities=[
+                make_ambiguity("section_0", {"gemini": interp}),
+                make_ambiguity("section_1", {"gemini": interp}),
+                make_ambiguity("section_2", {"gemini": other}),
+            ]
+        )
+        output = tmp_path / "ambiguities.json"
+        result.save(str(output))
+
+        loaded = DetectionResult.load(str(output))
+
+        first, second, third = (a.interpretations["gemini"] for a in loaded.ambiguities)
+        assert first is second
+        assert first is not third
+
+    def test_unhashable_list_entries_still_load(self, tmp_path):
+        """Non-string list entries from model output should not break loading."""
+        interp = Interpretation(model_name="codex", raw_response="", interpretation="X", steps=[{"step": 1}])
+        result = DetectionResult(ambiguities=[make_ambiguity("section_0", {"codex": interp})])
+        output = tmp_path / "ambiguities.json"
+        result.save(str(output))
+
+        loaded = DetectionResult.load(str(output))
+
+        assert loaded.ambiguities[0].interpretations["codex"].steps == [{"step": 1}]
+
+    def test_null_list_fields_still_load(self, tmp_path):
+        """A model's "steps": null (kept by the llm_judge strategy) should not break loading."""
+        interp = Interpretation(model_name="claude", raw_response="", interpretation="X", steps=None)
+        result = DetectionResult(ambiguities=[make_ambiguity("section_0", {"claude": interp})])
+        output = tmp_path / "ambiguities.json"
+        result.save(str(output))
+
+        loaded = DetectionResult.load(str(output))
+
+        assert loaded.ambiguities[0].interpretations["claude"].steps is None
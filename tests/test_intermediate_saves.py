@@ -71,21 +71,21 @@ def test_partial_file_contains_results_mid_run(mock_models_config, sample_sectio
 
         return res
 
-    # New strategy: use a mock for json.dump to trigger the failure after it's called twice
-    import json as json_module
+    # Interrupt the run when the third partial save is serialized (sections 0 and 1 already saved)
+    import json_codec
 
-    original_dump = json_module.dump
-    dump_count = 0
+    original_dumps = json_codec.dumps
+    dumps_count = 0
 
-    def failing_dump(*args, **kwargs):
-        nonlocal dump_count
-        original_dump(*args, **kwargs)
-        dump_count += 1
-        if dump_count == 2:
+    def failing_dumps(*args, **kwargs):
+        nonlocal dumps_count
+        dumps_count += 1
+        if dumps_count == 3:
             raise RuntimeError("Interrupted after 2nd save")
+        return original_dumps(*args, **kwargs)
 
     with patch.object(step.model_manager, "query_all", side_effect=side_effect):
-        with patch("json.dump", side_effect=failing_dump):
+        with patch("json_codec.dumps", side_effect=failing_dumps):
             try:
                 step.test_sections(sample_sections, ["claude"], output_path=str(temp_output))
             except RuntimeError:
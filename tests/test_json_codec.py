@@ -0,0 +1,129 @@
+"""Tests for the JSON codec used for model responses and workspace artifacts.
+
+Both the orjson backend and the stdlib fallback must produce identical files
+for the values the pipeline writes (see the json_codec module docstring for
+the known differences outside that set).
+"""
+
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Make scripts/src importable
+project_root = Path(__file__).resolve().parents[1]
+scripts_src = project_root.joinpath("scripts", "src")
+sys.path.insert(0, scripts_src.as_posix())
+
+import json_codec
+
+PAYLOAD = {
+    "section_0": {
+        "section": {"header": "Über", "content": "Línea 1\nLine 2"},
+        "results": {"claude": {"interpretation": "x", "steps": [], "similarity": 0.5, "agree": True}},
+    },
+    "empty": {},
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against both backends."""
+    if request.param == "orjson":
+        if json_codec.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return request.param
+
+
+@dataclass
+class Point:
+    x: int
+
+
+@pytest.mark.parametrize(
+    "payload, default",
+    [
+        (PAYLOAD, None),
+        ({"document_score": 0.3333333333333333, "scores": [1.0, 0.5, 0.0, 12.25]}, None),
+        ({"created": datetime(2024, 1, 1, 1, 2, 3), "path": Path("a/b"), "point": Point(1), "score": 0.1}, str),
+    ],
+    ids=["plain", "floats", "default_str"],
+)
+def test_dump_file_matches_stdlib_format(backend, tmp_path, payload, default):
+    output = tmp_path / "out.json"
+    json_codec.dump_file(payload, output, default=default)
+
+    assert output.read_text(encoding="utf-8") == json.dumps(payload, indent=2, ensure_ascii=False, default=default)
+
+
+def test_dumps_matches_dump_file(backend, tmp_path):
+    output = tmp_path / "out.json"
+    json_codec.dump_file(PAYLOAD, output)
+
+    assert json_codec.dumps(PAYLOAD) == output.read_bytes()
+
+
+def test_dump_file_uses_default_for_unknown_types(backend, tmp_path):
+    output = tmp_path / "out.json"
+    json_codec.dump_file({"path": Path("a/b")}, output, default=str)
+
+    assert json_codec.load_file(output) == {"path": "a/b"}
+
+
+def test_load_file_round_trip(backend, tmp_path):
+    output = tmp_path / "out.json"
+    json_codec.dump_file(PAYLOAD, output)
+
+    assert json_codec.load_file(output) == PAYLOAD
+
+
+def test_loads_accepts_str_and_bytes(backend):
+    assert json_codec.loads('{"ok": true}') == {"ok": True}
+    assert json_codec.loads(b'{"ok": true}') == {"ok": True}
+
+
+def test_loads_raises_stdlib_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads("not json")
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('```json\n{"a": 1}\n```', '{"a": 1}'),
+        ('```\n{"a": 1}\n```', '{"a": 1}'),
+        ('  {"a": 1}  ', '{"a": 1}'),
+        ('```json\n{"a": 1}', '{"a": 1}'),
+        ('{"a": "```"}', '{"a": "```"}'),
+        ("", ""),
+        ("```", ""),
+        ("```json```", ""),
+    ],
+)
+def test_strip_code_fences(text, expected):
+    assert json_codec.strip_code_fences(text) == expected
+
+
+def test_strip_code_fences_is_linear_on_long_whitespace():
+    text = "{" + " " * 200_000 + '"a": 1}'
+
+    assert json_codec.strip_code_fences(text) == text
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": 1}', {"a": 1}),
+        ("```json\n[1, 2]\n```", [1, 2]),
+        ("I would create three files.", None),
+        ('"just a string"', None),
+        ('{"a": ', None),
+    ],
+)
+def test_parse_response(backend, text, expected):
+    assert json_codec.parse_response(text) == expected
@@ -0,0 +1,172 @@
+"""Tests for ModelManager query dispatch."""
+
+import sys
+import threading
+from pathlib import Path
+
+# Make scripts/src importable
+project_root = Path(__file__).resolve().parents[1]
+scripts_src = project_root.joinpath("scripts", "src")
+sys.path.insert(0, scripts_src.as_posix())
+
+import model_interface
+from model_interface import ModelManager
+
+
+class FakeModel:
+    """Model stub that records calls and returns a canned response."""
+
+    def __init__(self, response=None, barrier=None, exc=None):
+        self.response = response or {"interpretation": "ok"}
+        self.barrier = barrier
+        self.exc = exc
+        self.calls = 0
+
+    def query(self, prompt):
+        self.calls += 1
+        if self.barrier is not None:
+            # Only passes if all models are queried concurrently
+            self.barrier.wait(timeout=5)
+        if self.exc is not None:
+            raise self.exc
+        return self.response
+
+
+def make_manager(models):
+    manager = ModelManager({})
+    manager.models = models
+    return manager
+
+
+class TestQueryAll:
+    """Tests for ModelManager.query_all."""
+
+    def test_models_are_queried_concurrently(self):
+        barrier = threading.Barrier(3)
+        manager = make_manager({name: FakeModel(barrier=barrier) for name in ["claude", "gemini", "codex"]})
+
+        results = manager.query_all("prompt", use_session=False)
+
+        assert all(res == {"interpretation": "ok"} for res in results.values())
+        assert not barrier.broken
+
+    def test_results_keep_requested_order(self):
+        manager = make_manager({"claude": FakeModel({"n": 1}), "gemini": FakeModel({"n": 2})})
+
+        results = manager.query_all("prompt", ["gemini", "missing", "claude"], use_session=False)
+
+        assert list(results) == ["gemini", "missing", "claude"]
+        assert results["gemini"] == {"n": 2}
+        assert results["claude"] == {"n": 1}
+
+    def test_unknown_model_returns_error(self):
+        manager = make_manager({"claude": FakeModel()})
+
+        results = manager.query_all("prompt", ["nope"], use_session=False)
+
+        assert results["nope"]["error"] is True
+        assert "not found" in results["nope"]["message"]
+
+    def test_exception_in_one_model_does_not_affect_others(self):
+        manager = make_manager({"claude": FakeModel(exc=RuntimeError("boom")), "gemini": FakeModel()})
+
+        results = manager.query_all("prompt", use_session=False)
+
+        assert results["claude"] == {"error": True, "message": "boom"}
+        assert results["gemini"] == {"interpretation": "ok"}
+
+
+class TestResponseCache:
+    """Tests for the stateless response cache in ModelManager.query."""
+
+    def test_identical_prompt_is_served_from_cache(self):
+        model = FakeModel({"interpretation": "cached"})
+        manager = make_manager({"claude": model})
+
+        first = manager.query("claude", "same prompt", use_session=False)
+        second = manager.query("claude", "same prompt", use_session=False)
+
+        assert first == second == {"interpretation": "cached"}
+        assert model.calls == 1
+
+    def test_cached_response_is_a_copy(self):
+        manager = make_manager({"claude": FakeModel({"steps": ["a"]})})
+
+        first = manager.query("claude", "prompt", use_session=False)
+        first["steps"].append("mutated")
+        second = manager.query("claude", "prompt", use_session=False)
+
+        assert second == {"steps": ["a"]}
+
+    def test_cache_is_per_model(self):
+        claude, gemini = FakeModel(), FakeModel()
+        manager = make_manager({"claude": claude, "gemini": gemini})
+
+        manager.query("claude", "prompt", use_session=False)
+        manager.query("gemini", "prompt", use_session=False)
+
+        assert claude.calls == 1
+        assert gemini.calls == 1
+
+    def test_error_responses_are_not_cached(self):
+        model = FakeModel({"error": True, "message": "Timeout"})
+        manager = make_manager({"claude": model})
+
+        manager.query("claude", "prompt", use_session=False)
+        manager.query("claude", "prompt", use_session=False)
+
+        assert model.calls == 2
+
+    def test_lru_eviction_and_clear(self):
+        model = FakeModel()
+        manager = make_manager({"claude": model})
+        manager.cache_size = 2
+
+        for prompt in ["p1", "p2", "p3"]:
+            manager.query("claude", prompt, use_session=False)
+        manager.query("claude", "p1", use_session=False)  # evicted -> queried again
+        assert model.calls == 4
+
+        manager.clear_cache()
+        manager.query("claude", "p3", use_session=False)
+        assert model.calls == 5
+
+    def test_cache_size_zero_disables_cache(self):
+        model = FakeModel()
+        manager = make_manager({"claude": model})
+        manager.cache_size = 0
+
+        manager.query("claude", "prompt", use_session=False)
+        manager.query("claude", "prompt", use_session=False)
+
+        assert model.calls == 2
+
+
+class TestInitSessions:
+    """Tests for ModelManager.init_sessions."""
+
+    def test_session_manager_is_reused_across_documents(self, monkeypatch):
+        created = []
+
+        class FakeSessionManager:
+            def __init__(self, models_config, session_config):
+                self.sessions = {}
+                created.append(self)
+
+            def cleanup_sessions(self):
+                self.sessions.clear()
+
+            def init_sessions_parallel(self, model_names, document, purpose=None):
+                self.sessions = {name: f"{document}-{name}" for name in model_names}
+                return dict(self.sessions)
+
+        monkeypatch.setattr(model_interface, "SessionManager", FakeSessionManager)
+        manager = ModelManager({}, session_config={"enabled": True})
+        manager.models = {"claude": FakeModel(), "gemini": FakeModel()}
+
+        manager.init_sessions("doc1", model_names=["claude", "gemini"])
+        second = manager.init_sessions("doc2", model_names=["claude"])
+
+        assert len(created) == 1
+        assert second == {"claude": "doc2-claude"}
+        assert created[0].sessions == {"claude": "doc2-claude"}
@@ -2,6 +2,7 @@
 
 import json
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -16,11 +17,13 @@ import polish  # noqa: E402
 import questioning_step as questioning_module  # noqa: E402
 import test_questions  # noqa: E402
 from questioning_step import (  # noqa: E402
+    QuestionEvaluation,
     QuestioningStep,
     QuestionSetValidationError,
     assign_verdict,
     calculate_document_score,
     calculate_question_score,
+    categorize_consensus,
     load_question_set,
     load_question_set_from_dict,
     map_issue_to_severity,
@@ -149,6 +152,39 @@ class TestScoring:
         assert calculate_document_score(scores) == pytest.approx(0.5)
 
 
+def _evaluation(model_name, verdict, matched=0):
+    return QuestionEvaluation(
+        question_id="q1",
+        model_name=model_name,
+        answer_text="",
+        verdict=verdict,
+        matched_key_points=matched,
+        total_key_points=2,
+    )
+
+
+class TestConsensus:
+    """Validate cross-model consensus categories."""
+
+    @pytest.mark.parametrize(
+        "verdicts, expected",
+        [
+            (["correct", "correct"], "all correct"),
+            (["evasive", "evasive"], "all evasive"),
+            (["incorrect", "incorrect"], "all incorrect (same way)"),
+            (["correct", "partial"], "mixed"),
+            ([], "mixed"),
+        ],
+    )
+    def test_categories(self, verdicts, expected):
+        evaluations = {f"m{i}": _evaluation(f"m{i}", verdict) for i, verdict in enumerate(verdicts)}
+        assert categorize_consensus(evaluations) == expected
+
+    def test_incorrect_in_different_ways_is_mixed(self):
+        evaluations = {"a": _evaluation("a", "incorrect", matched=0), "b": _evaluation("b", "incorrect", matched=1)}
+        assert categorize_consensus(evaluations) == "mixed"
+
+
 class TestIssueSeverityMapping:
     """Validate issue type to ambiguity severity mapping."""
 
@@ -471,3 +507,130 @@ class TestJudgeKeyPointIdentifierMatching:
         assert evaluation.matched_key_points == 1
         assert evaluation.total_key_points == 1
         assert evaluation.is_degraded is True
+
+    def test_first_entry_wins_when_judge_repeats_an_id(self, monkeypatch):
+        evaluation = self._run_eval(
+            monkeypatch,
+            {
+                "key_points": [
+                    {"id": "kp_auth", "point": "auth", "matched": True, "reason": "ok"},
+                    {"id": " kp_auth ", "point": "auth again", "matched": False, "reason": "dup"},
+                    {"id": "kp_checks", "point": "checks", "matched": True, "reason": "ok"},
+                    {"id": "kp_review", "point": "review", "matched": True, "reason": "ok"},
+                ],
+                "anti_points": [{"id": "ap_none", "point": "bad", "present": True, "reason": "found"}],
+                "is_evasive": False,
+                "reasoning": "duplicate ids",
+            },
+        )
+
+        assert evaluation.key_point_coverage["Only authorized users can merge"] is True
+        assert evaluation.matched_key_points == 3
+        assert evaluation.anti_points_present == ["Anyone can merge immediately"]
+
+
+class TestQuestioningRun:
+    """Validate the end-to-end question/answer/judge flow with stubbed models."""
+
+    JUDGE_PAYLOAD = {
+        "key_points": [{"id": "kp_1", "point": "p", "matched": True, "reason": "ok"}],
+        "anti_points": [],
+        "is_evasive": False,
+        "reasoning": "fine",
+    }
+
+    def _question_set(self, question_count=2):
+        return load_question_set_from_dict(
+            {
+                "version": "1.0",
+                "document": "doc.md",
+                "questions": [
+                    {
+                        "id": f"q{i}",
+                        "question": f"Question {i}?",
+                        "expected": {"key_points": [{"id": "kp_1", "point": "p"}]},
+                    }
+                    for i in range(1, question_count + 1)
+                ],
+            }
+        )
+
+    def _patch_models(self, monkeypatch, answers=None):
+        calls = {"query_all": [], "query": [], "managers": 0}
+        answers = answers or {}
+        judge_payload = self.JUDGE_PAYLOAD
+
+        class StubSessionInitStep:
+            def __init__(self, *_args, **_kwargs):
+                pass
+
+            def init_sessions(self, **_kwargs):
+                return type("SessionResult", (), {"session_manager": None})()
+
+        class StubModelManager:
+            def __init__(self, *_args, **_kwargs):
+                calls["managers"] += 1
+                self.session_manager = None
+
+            def query_all(self, prompt, model_names, use_session=True):
+                calls["query_all"].append((prompt, list(model_names)))
+                return {name: {"raw_response": answers.get(name, f"{name} answer")} for name in model_names}
+
+            def query(self, model_name, prompt, use_session=True):
+                calls["query"].append(model_name)
+                return judge_payload
+
+        monkeypatch.setattr(questioning_module, "SessionInitStep", StubSessionInitStep)
+        monkeypatch.setattr(questioning_module, "ModelManager", StubModelManager)
+        return calls
+
+    def test_models_are_queried_together_per_question(self, monkeypatch):
+        calls = self._patch_models(monkeypatch)
+        step = QuestioningStep(models_config={}, session_config={}, judge_model="claude")
+
+        result = step.run(self._question_set(), "doc", ["claude", "gemini"])
+
+        assert [names for _prompt, names in calls["query_all"]] == [["claude", "gemini"], ["claude", "gemini"]]
+        assert result.responses["q1"]["gemini"] == {"raw_response": "gemini answer"}
+        assert list(result.evaluations["q2"]) == ["claude", "gemini"]
+        assert result.evaluations["q2"]["gemini"].answer_text == "gemini answer"
+        assert result.document_score == 1.0
+
+    def test_judge_calls_run_concurrently_across_models(self, monkeypatch):
+        self._patch_models(monkeypatch)
+        barrier = threading.Barrier(2, timeout=5)
+        original_evaluate = QuestioningStep._evaluate_answer
+
+        def evaluate_together(step_self, question, model_name, answer_text):
+            barrier.wait()  # Both models' judge calls must be in flight at once
+            return original_evaluate(step_self, question=question, model_name=model_name, answer_text=answer_text)
+
+        monkeypatch.setattr(QuestioningStep, "_evaluate_answer", evaluate_together)
+        step = QuestioningStep(models_config={}, session_config={}, judge_model="claude")
+
+        result = step.run(self._question_set(question_count=1), "doc", ["claude", "gemini"])
+
+        assert set(result.evaluations["q1"]) == {"claude", "gemini"}
+        assert result.consensus["q1"] == "all correct"
+
+    def test_judge_model_manager_is_created_once(self, monkeypatch):
+        calls = self._patch_models(monkeypatch)
+        step = QuestioningStep(models_config={}, session_config={}, judge_model="claude")
+
+        step.run(self._question_set(question_count=3), "doc", ["claude", "gemini"])
+
+        # One manager for answering, one shared by all six judge calls
+        assert calls["managers"] == 2
+        assert calls["query"] == ["claude"] * 6
+
+    def test_identical_answers_share_one_judge_call(self, monkeypatch):
+        calls = self._patch_models(monkeypatch, answers={"claude": "Yes.", "gemini": "Yes.", "codex": "No."})
+        step = QuestioningStep(models_config={}, session_config={}, judge_model="claude")
+
+        result = step.run(self._question_set(question_count=1), "doc", ["claude", "gemini", "codex"])
+
+        assert len(calls["query"]) == 2
+        evaluations = result.evaluations["q1"]
+        assert [ev.model_name for ev in evaluations.values()] == ["claude", "gemini", "codex"]
+        assert evaluations["gemini"].answer_text == "Yes."
+        assert evaluations["gemini"].verdict == evaluations["claude"].verdict
@@ -0,0 +1,50 @@
+"""Tests for the keyword-based SimpleComparisonStrategy."""
+
+import sys
+from pathlib import Path
+
+# Make scripts/src importable
+project_root = Path(__file__).resolve().parents[1]
+scripts_src = project_root.joinpath("scripts", "src")
+sys.path.insert(0, scripts_src.as_posix())
+
+from ambiguity_detector import Interpretation, SimpleComparisonStrategy
+
+
+def make_interp(model_name, text, steps=None):
+    """Helper to create Interpretation objects for testing."""
+    return Interpretation(model_name=model_name, raw_response="", interpretation=text, steps=steps or ["a", "b"])
+
+
+class TestSimpleComparisonGroups:
+    """Tests for grouping models by similar interpretations."""
+
+    def test_groups_similar_models_together(self):
+        strategy = SimpleComparisonStrategy(similarity_threshold=0.7)
+        interpretations = [
+            make_interp("claude", "Create three config files in the project root"),
+            make_interp("gemini", "Create three config files in the project root"),
+            make_interp("codex", "Delete the database backups nightly"),
+        ]
+
+        result = strategy.compare(interpretations)
+
+        assert result["groups"] == [["claude", "gemini"], ["codex"]]
+        assert result["agree"] is False
+
+    def test_each_pair_similarity_computed_once(self, monkeypatch):
+        strategy = SimpleComparisonStrategy()
+        calls = []
+        original = strategy._calculate_similarity
+
+        def counting(elem1, elem2):
+            calls.append((elem1["model"], elem2["model"]))
+            return original(elem1, elem2)
+
+        monkeypatch.setattr(strategy, "_calculate_similarity", counting)
+        interpretations = [make_interp(name, f"Run step {name}") for name in ("claude", "gemini", "codex")]
+
+        strategy.compare(interpretations)
+
+        assert sorted(calls) == sorted(set(calls))
+        assert len(calls) == 3